@@ -1,25 +1,256 @@
+import asyncio
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import copy
 from datetime import datetime
 import hashlib
+import itertools
 import json
+import operator
 import os
+import queue
+import re
 import threading
 import time
+import zlib
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:  # pragma: no cover - optional dependency
     requests = None
     print("\u26a0\ufe0f 'requests' library not found. Install with: pip install requests")
 
+# Fastest available JSON library: orjson, then ujson, then the stdlib.
+# ``_json_loads`` accepts bytes and raises ValueError subclasses on bad
+# input; ``_json_dumps`` returns compact, single-line UTF-8 bytes.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+try:
+    import ujson
+except ImportError:  # pragma: no cover - optional dependency
+    ujson = None
+
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj)
+
+elif ujson is not None:
+    _json_loads = ujson.loads
+
+    def _json_dumps(obj):
+        return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode("utf-8")
+
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional dependency
+    ahocorasick = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
 
 # Allow overriding defaults via environment variables
 DEFAULT_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN", "YOUR_TELEGRAM_BOT_TOKEN")
 DEFAULT_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID", "YOUR_TARGET_CHAT_ID")
 AI_PROCESSOR_API_BASE = os.getenv("AI_PROCESSOR_API_BASE", "http://localhost:1234/v1")
+AI_PROCESSOR_MAX_WORKERS = int(os.getenv("AI_PROCESSOR_MAX_WORKERS", "8"))
+AI_CACHE_MAX_ENTRIES = 8192
 
 GROUPS_CONFIG_FILE = "telegram_groups.json"
+SAVE_DEBOUNCE_MS = 200
+CONFIG_POLL_MS = 20
+# Read buffer for the group config: one or two read() calls for typical files.
+CONFIG_READ_BUFFER = 64 * 1024
+# Groups handed from the config reader to the Tk thread per tree update.
+CONFIG_LOAD_BATCH = 100
+
+# Tcl lambda for ``apply``: inserts (id, name, chat id) triples into a
+# Treeview as stopped groups.
+_TREE_BULK_INSERT = (
+    "{tree rows} {foreach {id name chat} $rows"
+    " {$tree insert {} end -id $id -values [list $name $chat Stopped]}}"
+)
+
+
+def _iter_group_entries(fh):
+    """Yield group entries from a JSONL config file, one line at a time.
+
+    A line that fails to decode yields None and reading carries on with the
+    next one. Configs written before the JSONL format are a single JSON
+    array; those are recognised by the ``[`` opening their first non-blank
+    line and decoded whole.
+    """
+    first = True
+    for line in fh:
+        line = line.strip()
+        if not line:
+            continue
+        if first and line.startswith(b"["):
+            try:
+                yield from _json_loads(line + fh.read())
+            except ValueError:
+                yield None
+            return
+        first = False
+        try:
+            yield _json_loads(line)
+        except ValueError:
+            yield None
+
+
+LOG_LEVEL_COLORS = {
+    "INFO": "blue",
+    "SUCCESS": "green",
+    "WARNING": "orange",
+    "ERROR": "red",
+    "AI": "#8A2BE2",
+}
+LOG_FLUSH_INTERVAL_MS = 100
+
+# Lower-case substrings that mark a message as worth sending to the LLM.
+# Matching is deliberately loose: a false hit costs one LLM call, a miss
+# loses a dosing entry.
+MEDICATION_KEYWORDS = (
+    "mg", "mcg", "\u00b5g", "ml", "iu", "units", "dose", "dosage", "dosing",
+    "tablet", "pill", "capsule", "drop", "injection", "inhaler", "patch",
+    "med", "prescri", "pharma", "drug", "took", "take", "taking", "daily",
+    "side effect", "nausea", "dizz", "headache", "rash", "insomnia", "drows",
+    "fatigue", "vomit", "pain", "pril", "olol", "statin", "sartan", "azole",
+    "cillin", "mycin", "cycline", "oxetine", "azepam", "prazole", "profen",
+)
+
+
+def _build_keyword_matcher(keywords):
+    """Return a predicate telling whether ``text`` contains any keyword."""
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for word in keywords:
+            automaton.add_word(word, word)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text.lower()), None) is not None
+    pattern = re.compile("|".join(map(re.escape, keywords)))
+    return lambda text: pattern.search(text.lower()) is not None
+
+
+_mentions_medication = _build_keyword_matcher(MEDICATION_KEYWORDS)
+
+# Some local models wrap JSON replies in a ```json fenced block.
+_CODE_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*(.*?)\s*```\s*$", re.DOTALL)
+
+_UTF8_BOM = b"\xef\xbb\xbf"
+
+# (column, Telegram message key, default) for every parsed row, in row order.
+# Rows are plain tuples; ``msg_content`` is derived from the text fields.
+_MESSAGE_FIELDS = (
+    ("msg_id", "id", None),
+    ("sender", "from", "Unknown Sender"),
+    ("sender_id", "from_id", "Unknown_ID"),
+    ("reply_to_msg_id", "reply_to_message_id", ""),
+    ("date", "date", None),
+    ("date_unixtime", "date_unixtime", None),
+    ("msg_type", "media_type", "text"),
+    ("msg_content", "msg_content", ""),
+    ("forwarded_from", "forwarded_from", ""),
+    ("action", "action", ""),
+)
+MESSAGE_COLUMNS = tuple(column for column, _, _ in _MESSAGE_FIELDS)
+# Columns of ``AdvancedTelegramParserGUI.analyzed_chart_data``.
+ANALYSIS_COLUMNS = ("date", "sender", "medication", "dosage", "frequency", "side_effects")
+_MESSAGE_DEFAULTS = {key: default for _, key, default in _MESSAGE_FIELDS}
+_message_row = operator.itemgetter(*_MESSAGE_DEFAULTS)
+_get_text = operator.itemgetter("text")
+
+_CACHE_LAYOUT_KEY = b"telegram_parser.chats"
+# Schema metadata: how read_cache restores columns that were not stored as-is.
+_CACHE_ENCODING_KEY = b"telegram_parser.encodings"
+_COLUMN_DEFAULTS = {column: default for column, _, default in _MESSAGE_FIELDS}
+
+
+def _to_arrow_column(values, default):
+    """Convert a column to Arrow without losing value types.
+
+    Returns ``(array, encoding)``; ``encoding`` is None for a column stored
+    as-is, ``"default"`` when null stands for ``default`` and ``"json"``
+    when every value is stored as its JSON encoding.
+    """
+    try:
+        return pa.array(values), None
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        pass
+    # Usually a typed column mixed with its "" default (reply_to_msg_id).
+    # Storing the default as null keeps the column's type, as long as the
+    # column has no real nulls to confuse it with.
+    if default is not None and None not in values:
+        try:
+            return pa.array([None if v == default else v for v in values]), "default"
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass
+    return pa.array([_json_dumps(v) for v in values], type=pa.binary()), "json"
+
+
+# ijson prefixes used when streaming an export instead of loading it whole.
+_STREAM_MESSAGE_PREFIXES = frozenset({"messages.item", "chats.list.item.messages.item"})
+_STREAM_CHAT_META_KEYS = {
+    "name": "name",
+    "id": "id",
+    "chats.list.item.name": "name",
+    "chats.list.item.id": "id",
+}
+_JSON_SCALAR_EVENTS = frozenset({"string", "number", "boolean", "null"})
+_STREAM_PROGRESS_EVERY = 500
+# Exports at least this large are streamed. Streaming is about 3x slower
+# than decoding the whole buffer, but keeps peak memory near the parsed
+# rows instead of ~6x the file size.
+STREAM_PARSE_MIN_BYTES = 64 * 1024 * 1024
+
+
+def _dose_label(medication, dosage):
+    """Chart label for a dosing event; fields the LLM left out show as "?"."""
+    return f"{'?' if medication is None else medication} {'?' if dosage is None else dosage}"
+
+
+def _build_http_session(headers=None):
+    """Return a keep-alive ``requests.Session`` backed by a pooled adapter."""
+    if requests is None:
+        return None
+    session = requests.Session()
+    if headers:
+        session.headers.update(headers)
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
 
 
 class AIProcessor:
@@ -27,7 +258,9 @@ class AIProcessor:
 
     def __init__(self, api_base_url=AI_PROCESSOR_API_BASE):
         self.api_base_url = api_base_url.rstrip("/")
-        self.headers = {"Content-Type": "application/json"}
+        self.session = _build_http_session({"Content-Type": "application/json"})
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def _get_llm_response(self, system_prompt, user_prompt):
         url = f"{self.api_base_url}/chat/completions"
@@ -44,21 +277,44 @@ class AIProcessor:
             print("ERROR: 'requests' library is required for LLM communication.")
             return None
         try:
-            response = requests.post(url, headers=self.headers, json=payload, timeout=45)
+            response = self.session.post(url, json=payload, timeout=45)
             response.raise_for_status()
-            return response.json()
+            return _json_loads(response.content)
         except requests.exceptions.RequestException as exc:
             print(
                 f"ERROR: Could not connect to LLM API at {url}. Is the server running? Error: {exc}"
             )
             return None
-        except json.JSONDecodeError:
+        except ValueError:
             print(
                 f"ERROR: Failed to decode JSON from LLM response. Response text: {response.text}"
             )
             return None
 
+    @staticmethod
+    def _cache_key(message_text):
+        normalized = " ".join(message_text.lower().split())
+        return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+
     def extract_dosing_info(self, message_text):
+        """Return extracted dosing data, reusing results for repeated texts."""
+        key = self._cache_key(message_text)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return copy.deepcopy(cached)
+
+        result = self._request_dosing_info(message_text)
+        # Failed requests return None and are retried on the next call.
+        if result is not None:
+            with self._cache_lock:
+                self._cache[key] = copy.deepcopy(result)
+                if len(self._cache) > AI_CACHE_MAX_ENTRIES:
+                    self._cache.popitem(last=False)
+        return result
+
+    def _request_dosing_info(self, message_text):
         system_prompt = (
             """
 You are a precision medical data extraction tool. Your task is to analyze the user's message and extract any mention of medications, dosages, frequencies, and side effects.
@@ -81,13 +337,14 @@ If no dosing information is present, set "is_dosing_related" to false and the ot
 
         try:
             content = llm_response["choices"][0]["message"]["content"]
-            if content.startswith("```json"):
-                content = content.strip("```json").strip("`").strip()
-            parsed_json = json.loads(content)
+            fenced = _CODE_FENCE_RE.match(content)
+            if fenced:
+                content = fenced.group(1)
+            parsed_json = _json_loads(content)
             if "is_dosing_related" in parsed_json:
                 return parsed_json
             return None
-        except (json.JSONDecodeError, KeyError, TypeError) as exc:
+        except (ValueError, KeyError, TypeError) as exc:
             print(f"ERROR: Could not parse LLM JSON response. Error: {exc}, Response: {content}")
             return None
 
@@ -95,6 +352,18 @@ If no dosing information is present, set "is_dosing_related" to false and the ot
 class TelegramGroup:
     """Configuration for a monitored Telegram group."""
 
+    __slots__ = (
+        "id",
+        "name",
+        "chat_id",
+        "bot_token",
+        "auto_save",
+        "is_monitoring",
+        "monitor_instance",
+    )
+
+    _id_counter = itertools.count()
+
     def __init__(self, name, chat_id, bot_token=None, auto_save=False):
         self.name = name
         self.chat_id = str(chat_id)
@@ -102,7 +371,10 @@ class TelegramGroup:
         self.auto_save = auto_save
         self.is_monitoring = False
         self.monitor_instance = None
-        self.id = hashlib.md5(f"{self.name}-{self.chat_id}".encode()).hexdigest()
+        # Only used as a local Treeview/dict key: CRC32 (hardware-accelerated
+        # in zlib) plus a per-process counter keeps ids unique without MD5.
+        checksum = zlib.crc32(f"{self.name}-{self.chat_id}".encode())
+        self.id = f"{checksum:08x}{next(self._id_counter):04x}"
 
     def to_dict(self):
         return {
@@ -117,59 +389,217 @@ class TelegramChatParser:
     """Parses Telegram JSON export files."""
 
     def __init__(self):
-        self.columns = [
-            "msg_id",
-            "sender",
-            "sender_id",
-            "reply_to_msg_id",
-            "date",
-            "date_unixtime",
-            "msg_type",
-            "msg_content",
-            "forwarded_from",
-            "action",
-        ]
+        self.columns = list(MESSAGE_COLUMNS)
 
     def process_message(self, message):
         if message.get("type") != "message":
             return None
 
-        msg_content_parts = message.get("text", "")
-        if isinstance(message.get("text_entities"), list):
-            msg_content_parts = "".join(part["text"] for part in message["text_entities"])
-
-        return {
-            "msg_id": message.get("id"),
-            "sender": message.get("from", "Unknown Sender"),
-            "sender_id": message.get("from_id", "Unknown_ID"),
-            "reply_to_msg_id": message.get("reply_to_message_id", ""),
-            "date": message.get("date"),
-            "date_unixtime": message.get("date_unixtime"),
-            "msg_type": message.get("media_type", "text"),
-            "msg_content": str(msg_content_parts).replace("\n", " ").strip(),
-            "forwarded_from": message.get("forwarded_from", ""),
-            "action": message.get("action", ""),
-        }
+        # JSON decoders only produce plain lists, so an exact class check
+        # stands in for the isinstance MRO walk.
+        text_entities = message.get("text_entities")
+        if text_entities.__class__ is list:
+            msg_content_parts = "".join(map(_get_text, text_entities))
+        else:
+            msg_content_parts = message.get("text", "")
+
+        fields = {**_MESSAGE_DEFAULTS, **message}
+        fields["msg_content"] = str(msg_content_parts).replace("\n", " ").strip()
+        return _message_row(fields)
+
+    def _chat_name(self, jdata):
+        return jdata.get("name", f"Chat_ID_{jdata.get('id', 'Unknown')}")
+
+    def _build_chat(self, chat_name, rows):
+        """Return a chat whose row tuples are transposed into per-column lists."""
+        if rows:
+            column_values = [list(values) for values in zip(*rows)]
+        else:
+            column_values = [[] for _ in MESSAGE_COLUMNS]
+        return {"chat": chat_name, "columns": dict(zip(MESSAGE_COLUMNS, column_values))}
 
     def process_chat(self, jdata):
-        chat_name = jdata.get("name", f"Chat_ID_{jdata.get('id', 'Unknown')}")
         rows = [
             processed
             for msg in jdata.get("messages", [])
             if (processed := self.process_message(msg))
         ]
-        return {"chat": chat_name, "rows": rows}
+        return self._build_chat(self._chat_name(jdata), rows)
+
+    def _stream_chats(self, input_file, progress_callback=None):
+        """Yield chats while decoding messages one at a time with ijson."""
+        total_bytes = os.fstat(input_file.fileno()).st_size
+        root_meta, root_rows = {}, []
+        meta, rows = root_meta, root_rows
+        has_chat_list = False
+        builder = None
+        seen = 0
+        for prefix, event, value in ijson.parse(input_file, use_float=True):
+            if builder is not None:
+                builder.event(event, value)
+                if event == "end_map" and prefix in _STREAM_MESSAGE_PREFIXES:
+                    if processed := self.process_message(builder.value):
+                        rows.append(processed)
+                    builder = None
+                    seen += 1
+                    if progress_callback and seen % _STREAM_PROGRESS_EVERY == 0:
+                        progress_callback(input_file.tell(), total_bytes)
+                continue
+            if event == "start_map":
+                if prefix in _STREAM_MESSAGE_PREFIXES:
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                elif prefix == "chats.list.item":
+                    meta, rows = {}, []
+            elif event == "end_map" and prefix == "chats.list.item":
+                yield self._build_chat(self._chat_name(meta), rows)
+                meta, rows = root_meta, root_rows
+            elif event == "map_key" and prefix == "chats" and value == "list":
+                has_chat_list = True
+            elif prefix in _STREAM_CHAT_META_KEYS and event in _JSON_SCALAR_EVENTS:
+                meta[_STREAM_CHAT_META_KEYS[prefix]] = value
+        if not has_chat_list:
+            yield self._build_chat(self._chat_name(root_meta), root_rows)
+
+    def iter_chats(self, chat_history_json_path, progress_callback=None):
+        """Yield parsed chats; ``progress_callback(bytes_read, total_bytes)``
+        is called periodically while the export is read."""
+        with open(chat_history_json_path, "rb") as input_file:
+            if input_file.read(len(_UTF8_BOM)) != _UTF8_BOM:
+                input_file.seek(0)
+            file_size = os.fstat(input_file.fileno()).st_size
+            if ijson is not None and file_size >= STREAM_PARSE_MIN_BYTES:
+                yield from self._stream_chats(input_file, progress_callback)
+                buf = None
+            else:
+                buf = input_file.read()
+            total_bytes = input_file.tell()
+        if buf is not None:
+            jdata = _json_loads(buf)
+            if "chats" in jdata and "list" in jdata["chats"]:
+                for chat_data in jdata["chats"]["list"]:
+                    yield self.process_chat(chat_data)
+            else:
+                yield self.process_chat(jdata)
+        if progress_callback:
+            progress_callback(total_bytes, total_bytes)
+
+    def process(self, chat_history_json_path, progress_callback=None):
+        return list(self.iter_chats(chat_history_json_path, progress_callback))
+
+    # ------------------------------------------------------------------
+    # Arrow/Feather cache of parsed exports
+    def cache_path(self, chat_history_json_path):
+        return f"{chat_history_json_path}.feather"
+
+    def has_fresh_cache(self, chat_history_json_path):
+        """Return True if a Feather cache at least as new as the export exists."""
+        if pa is None:
+            return False
+        cache_path = self.cache_path(chat_history_json_path)
+        try:
+            return os.path.getmtime(cache_path) >= os.path.getmtime(chat_history_json_path)
+        except OSError:
+            return False
+
+    def write_cache(self, chats, chat_history_json_path):
+        """Store parsed chats as one zstd-compressed Feather (Arrow IPC) table.
+
+        All chats share the table's columns; the chat names and row counts
+        are kept in the schema metadata so ``read_cache`` can split them again.
+        """
+        column_values = {column: [] for column in MESSAGE_COLUMNS}
+        layout = []
+        for chat in chats:
+            layout.append([chat["chat"], len(chat["columns"]["msg_id"])])
+            for column, values in chat["columns"].items():
+                column_values[column].extend(values)
+        arrays = {}
+        encodings = {}
+        for column, values in column_values.items():
+            arrays[column], encoding = _to_arrow_column(values, _COLUMN_DEFAULTS[column])
+            if encoding is not None:
+                encodings[column] = encoding
+        table = pa.table(arrays).replace_schema_metadata(
+            {
+                _CACHE_LAYOUT_KEY: _json_dumps(layout),
+                _CACHE_ENCODING_KEY: _json_dumps(encodings),
+            }
+        )
+        cache_path = self.cache_path(chat_history_json_path)
+        tmp_path = f"{cache_path}.tmp"
+        feather.write_feather(table, tmp_path, compression="zstd")
+        os.replace(tmp_path, cache_path)
+
+    def read_cache(self, chat_history_json_path):
+        table = feather.read_table(self.cache_path(chat_history_json_path), memory_map=True)
+        metadata = table.schema.metadata
+        layout = _json_loads(metadata[_CACHE_LAYOUT_KEY])
+        # Caches written before encodings were recorded raise KeyError here
+        # and are re-parsed by the caller.
+        encodings = _json_loads(metadata[_CACHE_ENCODING_KEY])
+        column_values = table.to_pydict()
+        for column, encoding in encodings.items():
+            values = column_values[column]
+            if encoding == "default":
+                default = _COLUMN_DEFAULTS[column]
+                column_values[column] = [default if v is None else v for v in values]
+            else:
+                column_values[column] = [_json_loads(v) for v in values]
+        chats = []
+        start = 0
+        for chat_name, count in layout:
+            end = start + count
+            chats.append(
+                {
+                    "chat": chat_name,
+                    "columns": {
+                        column: column_values[column][start:end] for column in MESSAGE_COLUMNS
+                    },
+                }
+            )
+            start = end
+        return chats
+
 
-    def process(self, chat_history_json_path):
-        with open(chat_history_json_path, "r", encoding="utf-8-sig") as input_file:
-            jdata = json.load(input_file)
-        if "chats" in jdata and "list" in jdata["chats"]:
-            return [self.process_chat(chat_data) for chat_data in jdata["chats"]["list"]]
-        return [self.process_chat(jdata)]
+class _AsyncLoopThread:
+    """Background asyncio loop shared by every async Telegram monitor."""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._session = None
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+
+    def submit(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    async def get_session(self):
+        # Created lazily on the loop thread, as aiohttp requires.
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+
+_async_loop_thread = None
+_async_loop_lock = threading.Lock()
+
+
+def _get_async_loop_thread():
+    """Return the shared asyncio loop thread, starting it on first use."""
+    global _async_loop_thread
+    with _async_loop_lock:
+        if _async_loop_thread is None:
+            _async_loop_thread = _AsyncLoopThread()
+    return _async_loop_thread
 
 
 class TelegramMonitor:
-    """Polls the Telegram API and forwards messages to callbacks."""
+    """Polls the Telegram API and forwards messages to callbacks.
+
+    With aiohttp installed every monitor is a coroutine on one shared event
+    loop and HTTP session; otherwise each monitor polls from its own thread.
+    """
 
     def __init__(self, bot_token, chat_id, group_id, message_callback, status_callback):
         self.bot_token = bot_token
@@ -180,22 +610,112 @@ class TelegramMonitor:
         self.running = False
         self.last_update_id = 0
         self.thread = None
+        self.task = None
+        self.session = _build_http_session() if aiohttp is None else None
 
     def start(self):
-        if self.running:
-            return
-        self.running = True
-        self.last_update_id = 0
-        self.thread = threading.Thread(target=self._poll_updates, daemon=True)
-        self.thread.start()
-        self.status_callback("Monitoring started successfully.", "success", self.group_id)
+        self.start_many([self])
+
+    @classmethod
+    def start_many(cls, monitors):
+        """Start ``monitors``; on the asyncio path they share one hop onto the loop."""
+        monitors = [monitor for monitor in monitors if not monitor.running]
+        for monitor in monitors:
+            monitor.running = True
+            monitor.last_update_id = 0
+        if aiohttp is not None:
+            _get_async_loop_thread().submit(cls._spawn_polls(monitors))
+        else:
+            for monitor in monitors:
+                monitor.thread = threading.Thread(target=monitor._poll_updates, daemon=True)
+                monitor.thread.start()
+        for monitor in monitors:
+            monitor.status_callback("Monitoring started successfully.", "success", monitor.group_id)
+
+    @staticmethod
+    async def _spawn_polls(monitors):
+        loop = asyncio.get_running_loop()
+        for monitor in monitors:
+            # A monitor stopped before this ran never starts polling.
+            if monitor.running:
+                monitor.task = loop.create_task(monitor._poll_updates_async())
 
     def stop(self):
         self.running = False
+        if self.task is not None:
+            # asyncio tasks may only be cancelled from their own loop.
+            self.task.get_loop().call_soon_threadsafe(self.task.cancel)
+            self.task = None
         if self.thread and self.thread.is_alive():
             self.thread.join(timeout=2)
         self.status_callback("Monitoring stopped.", "info", self.group_id)
 
+    def _handle_updates(self, data):
+        """Dispatch a getUpdates payload; return False if the API reported an error."""
+        if data.get("ok") and data.get("result"):
+            for update in data["result"]:
+                self.last_update_id = update["update_id"]
+                if (
+                    "message" in update
+                    and str(update["message"].get("chat", {}).get("id"))
+                    == self.chat_id
+                ):
+                    self.message_callback(update["message"], self.group_id)
+        elif not data.get("ok"):
+            self.status_callback(
+                f"API Error: {data.get('description')}",
+                "error",
+                self.group_id,
+            )
+            return False
+        return True
+
+    async def _poll_updates_async(self):
+        self.status_callback(
+            f"Polling for updates from chat ID: {self.chat_id}...",
+            "info",
+            self.group_id,
+        )
+        session = await _get_async_loop_thread().get_session()
+        url = f"https://api.telegram.org/bot{self.bot_token}/getUpdates"
+        timeout = aiohttp.ClientTimeout(total=35)
+        while self.running:
+            try:
+                params = {
+                    "offset": self.last_update_id + 1,
+                    "timeout": 30,
+                    "allowed_updates": '["message"]',
+                }
+                async with session.get(url, params=params, timeout=timeout) as response:
+                    if not self.running:
+                        break
+                    if response.status == 200:
+                        if not self._handle_updates(_json_loads(await response.read())):
+                            await asyncio.sleep(10)
+                    elif response.status == 401:
+                        self.status_callback(
+                            "API Error: Unauthorized. Check bot token.",
+                            "error",
+                            self.group_id,
+                        )
+                        self.stop()
+                        break
+                    else:
+                        self.status_callback(
+                            f"HTTP Error {response.status}", "error", self.group_id
+                        )
+                        await asyncio.sleep(10)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                self.status_callback(
+                    f"Network Error: {exc}", "error", self.group_id
+                )
+                await asyncio.sleep(15)
+            except Exception as exc:  # noqa: BLE001
+                self.status_callback(
+                    f"Polling Error: {exc}", "error", self.group_id
+                )
+                await asyncio.sleep(10)
+
     def _poll_updates(self):
         self.status_callback(
             f"Polling for updates from chat ID: {self.chat_id}...",
@@ -205,6 +725,8 @@ class TelegramMonitor:
         if requests is None:
             self.status_callback("'requests' library missing. Install with: pip install requests", "error", self.group_id)
             return
+        # getUpdates long-polls for up to 30 s, so a successful poll loops
+        # straight back; sleeps are backoff and live in the error branches only.
         while self.running:
             try:
                 url = f"https://api.telegram.org/bot{self.bot_token}/getUpdates"
@@ -213,26 +735,11 @@ class TelegramMonitor:
                     "timeout": 30,
                     "allowed_updates": ["message"],
                 }
-                response = requests.get(url, params=params, timeout=35)
+                response = self.session.get(url, params=params, timeout=35)
                 if not self.running:
                     break
                 if response.status_code == 200:
-                    data = response.json()
-                    if data.get("ok") and data.get("result"):
-                        for update in data["result"]:
-                            self.last_update_id = update["update_id"]
-                            if (
-                                "message" in update
-                                and str(update["message"].get("chat", {}).get("id"))
-                                == self.chat_id
-                            ):
-                                self.message_callback(update["message"], self.group_id)
-                    elif not data.get("ok"):
-                        self.status_callback(
-                            f"API Error: {data.get('description')}",
-                            "error",
-                            self.group_id,
-                        )
+                    if not self._handle_updates(response.json()):
                         time.sleep(10)
                 elif response.status_code == 401:
                     self.status_callback(
@@ -257,7 +764,6 @@ class TelegramMonitor:
                     f"Polling Error: {exc}", "error", self.group_id
                 )
                 time.sleep(10)
-            time.sleep(1)
 
 
 class AdvancedTelegramParserGUI:
@@ -270,13 +776,35 @@ class AdvancedTelegramParserGUI:
 
         self.parser = TelegramChatParser()
         self.ai_processor = AIProcessor()
-        self.telegram_groups = {}
+        # Groups in display order for bulk paths, plus an id -> group map for
+        # lookups. Monitor status callbacks look groups up from their own
+        # threads, so a lookup must be a single dict access.
+        self._groups = []
+        self._group_by_id = {}
+        # Serialised form of each group, kept in step with _groups so a save
+        # does not rebuild every entry.
+        self._group_dicts = {}
         self.default_bot_token = tk.StringVar(value=DEFAULT_BOT_TOKEN)
 
         self.input_file_path = tk.StringVar()
         self.output_dir_path = tk.StringVar()
         self.current_parsed_data = None
-        self.analyzed_chart_data = []
+        self._chart_data_version = 0
+        self._set_analyzed_chart_data(self._empty_analysis())
+        self._log_queue = deque()
+        self._log_flush_pending = False
+        self._save_after_id = None
+        self._group_dialog = None
+        self._pending_status_updates = set()
+        # Ids of groups with a live monitor; the start/stop guard.
+        self._running = set()
+        self._groups_loaded = False
+        self._save_after_load = False
+        self._loaded_groups = queue.Queue()
+        self._io_queue = queue.Queue()
+        self._last_saved_hash = None  # only touched by the writer thread
+        self._io_thread = threading.Thread(target=self._config_writer, daemon=True)
+        self._io_thread.start()
 
         self._setup_styles()
         self._setup_gui_layout()
@@ -284,31 +812,52 @@ class AdvancedTelegramParserGUI:
 
     # ------------------------------------------------------------------
     # Logging helpers
+    def _configure_log_tags(self, text_widget):
+        for level, color in LOG_LEVEL_COLORS.items():
+            text_widget.tag_configure(level.lower(), foreground=color)
+
     def _log_to_gui(self, text_widget, message, level="INFO"):
-        timestamp_str = datetime.now().strftime("%H:%M:%S")
-        colors = {
-            "INFO": "blue",
-            "SUCCESS": "green",
-            "WARNING": "orange",
-            "ERROR": "red",
-            "AI": "#8A2BE2",
-        }
-        tag_name = level.lower()
-        text_widget.tag_configure(tag_name, foreground=colors.get(level, "black"))
+        """Queue a log line; lines are written in batches by ``_flush_logs``.
 
-        text_widget.configure(state="normal")
-        text_widget.insert(
-            tk.END, f"[{timestamp_str}] [{level}] ", (tag_name, "bold_tag")
-        )
-        text_widget.insert(tk.END, f"{message}\n")
-        text_widget.configure(state="disabled")
-        text_widget.see(tk.END)
+        Worker threads (the monitors' status callbacks) may call it once the
+        main loop is running: besides the deque append it only arms the flush
+        timer with ``root.after``, which a threaded Tcl hands to the Tk thread.
+        Code that can run before ``mainloop`` must log from the Tk thread.
+        """
+        timestamp_str = datetime.now().strftime("%H:%M:%S")
+        self._log_queue.append((text_widget, timestamp_str, level, message))
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
+            self.root.after(LOG_FLUSH_INTERVAL_MS, self._flush_logs)
+
+    def _flush_logs(self):
+        self._log_flush_pending = False
+        batches = {}
+        while self._log_queue:
+            text_widget, timestamp_str, level, message = self._log_queue.popleft()
+            batches.setdefault(text_widget, []).extend(
+                (
+                    f"[{timestamp_str}] [{level}] ",
+                    (level.lower(), "bold_tag"),
+                    f"{message}\n",
+                    (),
+                )
+            )
+        for text_widget, chunks in batches.items():
+            text_widget.configure(state="normal")
+            text_widget.insert(tk.END, *chunks)
+            text_widget.configure(state="disabled")
+            text_widget.see(tk.END)
 
     def _log_to_results_feed(self, message, level="INFO"):
         self._log_to_gui(self.results_text_area, message, level)
 
-    def _log_to_monitor_feed(self, message, level="INFO"):
-        self._log_to_gui(self.live_monitor_feed_area, message, level)
+    def _log_to_monitor_feed(self, message, level="INFO", group_id=None):
+        # TelegramMonitor reports with lower-case levels and its group id.
+        group = self._get_group(group_id) if group_id else None
+        if group:
+            message = f"[{group.name}] {message}"
+        self._log_to_gui(self.live_monitor_feed_area, message, level.upper())
 
     # ------------------------------------------------------------------
     # GUI setup
@@ -354,6 +903,15 @@ class AdvancedTelegramParserGUI:
             side=tk.RIGHT
         )
 
+        # Off by default: it writes a file into the user's export folder.
+        self.use_parse_cache = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            fs_frame,
+            text="Reuse cached parse (.feather next to the export) when it is up to date",
+            variable=self.use_parse_cache,
+            state="normal" if pa is not None else "disabled",
+        ).pack(anchor="w", pady=(5, 0))
+
         action_frame = ttk.Frame(tab)
         action_frame.pack(pady=15)
         self.parse_file_button = ttk.Button(
@@ -369,13 +927,14 @@ class AdvancedTelegramParserGUI:
         )
         self.analyze_ai_button.pack(side=tk.LEFT, padx=10)
 
-        self.parse_progress_bar = ttk.Progressbar(tab, mode="indeterminate", length=300)
+        self.parse_progress_bar = ttk.Progressbar(tab, mode="determinate", length=300)
         self.parse_progress_bar.pack(pady=5)
 
         self.results_text_area = scrolledtext.ScrolledText(
             tab, height=20, wrap=tk.WORD, state="disabled"
         )
         self.results_text_area.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        self._configure_log_tags(self.results_text_area)
         self._log_to_results_feed(
             "Welcome! Select a JSON file and output directory, then click 'Start Parsing'.",
             "INFO",
@@ -440,12 +999,26 @@ class AdvancedTelegramParserGUI:
             tab, height=15, wrap=tk.WORD, state="disabled"
         )
         self.live_monitor_feed_area.pack(fill=tk.BOTH, expand=True, padx=10, pady=(10, 5))
+        self._configure_log_tags(self.live_monitor_feed_area)
         self._log_to_monitor_feed("Add groups to begin monitoring.", "INFO")
 
     # ------------------------------------------------------------------
     def _create_analytics_tab(self, notebook):
         self.analytics_tab = ttk.Frame(notebook)
         notebook.add(self.analytics_tab, text="\U0001F4CA Step 2: Visualize Data")
+        # matplotlib is only imported once this tab is first shown.
+        self._plot_ready = False
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+    def _on_tab_changed(self, event):
+        if event.widget.select() == str(self.analytics_tab):
+            self._ensure_plot_ready()
+
+    def _ensure_plot_ready(self):
+        """Import matplotlib and build the chart widgets on first use."""
+        if self._plot_ready:
+            return
+        self._plot_ready = True
 
         try:
             import matplotlib
@@ -479,6 +1052,9 @@ class AdvancedTelegramParserGUI:
         self.fig = Figure(figsize=(10, 6), dpi=100)
         self.canvas = FigureCanvasTkAgg(self.fig, self.analytics_tab)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self._build_chart_axes()
+        # The chart series are only derived once matplotlib is available.
+        self._set_analyzed_chart_data(self.analyzed_chart_data)
         self._update_chart()
 
     # ------------------------------------------------------------------
@@ -490,6 +1066,11 @@ class AdvancedTelegramParserGUI:
             self.input_file_path.set(path)
             self.input_file_label.config(text=os.path.basename(path))
             self._log_to_results_feed(f"Input file set: {os.path.basename(path)}", "INFO")
+            if self.use_parse_cache.get() and self.parser.has_fresh_cache(path):
+                self._log_to_results_feed(
+                    "Found an up-to-date cached parse; it will be loaded instead of the JSON.",
+                    "INFO",
+                )
 
     def _select_output_dir_dialog(self):
         path = filedialog.askdirectory(title="Select Output Directory for Exports")
@@ -506,23 +1087,55 @@ class AdvancedTelegramParserGUI:
             return
         self.parse_file_button.config(state="disabled")
         self.analyze_ai_button.config(state="disabled")
-        self.parse_progress_bar.start()
+        self.parse_progress_bar.config(mode="determinate", maximum=100, value=0)
         self._log_to_results_feed("Parsing started...", "INFO")
         threading.Thread(target=self._execute_parsing, daemon=True).start()
 
+    def _report_parse_progress(self, bytes_read, total_bytes):
+        percent = 100 * bytes_read / total_bytes if total_bytes else 100
+        self.root.after(0, lambda: self.parse_progress_bar.config(value=percent))
+
+    def _load_parse_cache(self, path):
+        try:
+            return self.parser.read_cache(path)
+        except Exception as exc:  # noqa: BLE001
+            self.root.after(
+                0,
+                self._log_to_results_feed,
+                f"Cached parse unreadable, re-parsing JSON: {exc}",
+                "WARNING",
+            )
+            return None
+
+    def _write_parse_cache(self, path, data):
+        try:
+            self.parser.write_cache(data, path)
+        except Exception as exc:  # noqa: BLE001
+            self.root.after(
+                0, self._log_to_results_feed, f"Could not write parse cache: {exc}", "WARNING"
+            )
+
     def _execute_parsing(self):
         try:
-            data = self.parser.process(self.input_file_path.get())
+            path = self.input_file_path.get()
+            use_cache = self.use_parse_cache.get()
+            data = None
+            if use_cache and self.parser.has_fresh_cache(path):
+                data = self._load_parse_cache(path)
+            if data is None:
+                data = self.parser.process(path, self._report_parse_progress)
+                if use_cache and pa is not None:
+                    self._write_parse_cache(path, data)
             self.current_parsed_data = data
             self.root.after(0, self._parsing_finished, data)
         except Exception as exc:  # noqa: BLE001
             self.root.after(0, self._parsing_failed, exc)
 
     def _parsing_finished(self, data):
-        self.parse_progress_bar.stop()
+        self.parse_progress_bar.config(value=100)
         self.parse_file_button.config(state="normal")
         self.analyze_ai_button.config(state="normal")
-        num_messages = sum(len(chat.get("rows", [])) for chat in data)
+        num_messages = sum(len(chat["columns"]["msg_id"]) for chat in data)
         msg = (
             f"Parsing complete! Processed {num_messages} messages. Ready for AI Analysis."
         )
@@ -543,42 +1156,91 @@ class AdvancedTelegramParserGUI:
             )
             return
         self.analyze_ai_button.config(state="disabled")
+        self._set_analyzed_chart_data(self._empty_analysis())
+        self.parse_progress_bar.config(mode="indeterminate")
         self.parse_progress_bar.start()
         self._log_to_results_feed(
             "Starting AI analysis on all messages... This may take a while.", "INFO"
         )
         threading.Thread(target=self._execute_ai_analysis, daemon=True).start()
 
-    def _execute_ai_analysis(self):
-        self.analyzed_chart_data = []
-        all_rows = [row for chat in self.current_parsed_data for row in chat["rows"]]
+    @staticmethod
+    def _empty_analysis():
+        return {column: [] for column in ANALYSIS_COLUMNS}
 
-        for i, row in enumerate(all_rows):
-            content = row.get("msg_content")
-            if not content:
-                continue
+    def _set_analyzed_chart_data(self, data):
+        """Store AI results and pre-parse the series every chart redraw slices."""
+        self.analyzed_chart_data = data
+        self._chart_data_version += 1
+        self._event_times = self._med_mask = self._side_effect_mask = None
+        if not data["date"] or not getattr(self, "matplotlib_available", False):
+            return
+        import numpy as np
 
-            if i % 10 == 0:
-                self.root.after(
-                    0,
-                    lambda i=i: self._log_to_results_feed(
-                        f"AI processing message {i+1}/{len(all_rows)}...", "INFO"
-                    ),
-                )
+        self._event_times = np.array(data["date"], dtype="datetime64[s]")
+        self._med_mask = np.array(
+            [bool(med or dose) for med, dose in zip(data["medication"], data["dosage"])],
+            dtype=bool,
+        )
+        self._side_effect_mask = np.array(
+            [bool(side_effects) for side_effects in data["side_effects"]], dtype=bool
+        )
+
+    def _execute_ai_analysis(self):
+        tasks = []
+        skipped = 0
+        for chat in self.current_parsed_data:
+            columns = chat["columns"]
+            for task in zip(columns["msg_content"], columns["date"], columns["sender"]):
+                if not task[0]:
+                    continue
+                # Small talk never reaches the LLM; only keyword hits are sent.
+                if _mentions_medication(task[0]):
+                    tasks.append(task)
+                else:
+                    skipped += 1
+        if skipped:
+            self.root.after(
+                0,
+                self._log_to_results_feed,
+                f"Skipped {skipped} messages with no medication keywords.",
+                "INFO",
+            )
+        results = [None] * len(tasks)
+
+        # LLM calls are network-bound, so overlapping them in threads scales
+        # with the number of requests the server accepts concurrently.
+        with ThreadPoolExecutor(max_workers=AI_PROCESSOR_MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(self.ai_processor.extract_dosing_info, content): i
+                for i, (content, _, _) in enumerate(tasks)
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                if done % 10 == 0:
+                    self.root.after(
+                        0,
+                        lambda done=done: self._log_to_results_feed(
+                            f"AI processed {done}/{len(tasks)} messages...", "INFO"
+                        ),
+                    )
+                results[futures[future]] = future.result()
 
-            extracted_info = self.ai_processor.extract_dosing_info(content)
+        analyzed = self._empty_analysis()
+        for (_, date, sender), extracted_info in zip(tasks, results):
             if extracted_info and extracted_info.get("is_dosing_related"):
-                extracted_info["date"] = row.get("date")
-                extracted_info["sender"] = row.get("sender")
-                self.analyzed_chart_data.append(extracted_info)
+                analyzed["date"].append(date)
+                analyzed["sender"].append(sender)
+                for key in ("medication", "dosage", "frequency", "side_effects"):
+                    analyzed[key].append(extracted_info.get(key))
 
-        self.root.after(0, self._ai_analysis_finished)
+        self.root.after(0, self._ai_analysis_finished, analyzed)
 
-    def _ai_analysis_finished(self):
+    def _ai_analysis_finished(self, analyzed):
+        self._set_analyzed_chart_data(analyzed)
         self.parse_progress_bar.stop()
         self.analyze_ai_button.config(state="normal")
         msg = (
-            f"AI Analysis complete! Found {len(self.analyzed_chart_data)} dosing-related "
+            f"AI Analysis complete! Found {len(self.analyzed_chart_data['date'])} dosing-related "
             "entries. You can now use the 'Analytics' tab."
         )
         self._log_to_results_feed(msg, "SUCCESS")
@@ -593,9 +1255,8 @@ class AdvancedTelegramParserGUI:
         )
 
     def _process_and_display_live_message(self, message_data, group_id):
-        group_name = self.telegram_groups.get(
-            group_id, TelegramGroup("Unknown", "0")
-        ).name
+        group = self._get_group(group_id)
+        group_name = group.name if group else "Unknown"
         sender = message_data.get("from", {}).get("first_name", "Unknown")
         text = message_data.get("text", "[Non-text message or empty]")
         msg_id = message_data.get("message_id", "N/A")
@@ -630,209 +1291,295 @@ class AdvancedTelegramParserGUI:
 
     # ------------------------------------------------------------------
     # Charting helpers
+    def _build_chart_axes(self):
+        """Create both chart axes and their artists once; redraws only update them."""
+        import matplotlib.dates as mdates
+
+        timeline = self.fig.add_subplot(111, label="timeline")
+        timeline.set_title("Dosing Timeline (based on AI Analysis)")
+        correlation = self.fig.add_subplot(111, label="correlation")
+        correlation.set_title("Medication vs. Side Effect Timeline (based on AI Analysis)")
+        for ax in (timeline, correlation):
+            ax.xaxis_date()
+            ax.xaxis.set_major_formatter(mdates.DateFormatter("%Y-%m-%d"))
+            ax.set_ylim(0.95, 1.05)
+            ax.set_yticks([])
+
+        (self._timeline_line,) = timeline.plot(
+            [], [], "o", markersize=8, color="green", alpha=0.7
+        )
+        (self._med_line,) = correlation.plot(
+            [], [], "o", markersize=10, color="blue", alpha=0.7, label="Medication Taken"
+        )
+        (self._side_effect_line,) = correlation.plot(
+            [], [], "X", markersize=12, color="red", alpha=0.9, label="Side Effect Reported"
+        )
+        self._correlation_legend = correlation.legend(loc="upper right")
+        self._timeline_notice = timeline.text(
+            0.5, 0.5, "", ha="center", va="center", transform=timeline.transAxes
+        )
+        self._correlation_notice = correlation.text(
+            0.5, 0.5, "", ha="center", transform=correlation.transAxes
+        )
+
+        self._ax_timeline = timeline
+        self._ax_correlation = correlation
+        self._chart_labels = {timeline: [], correlation: []}
+        # Data version each axis last rendered; switching charts alone is free.
+        self._rendered_chart_version = {timeline: None, correlation: None}
+        # x-range each axis last rotated its tick labels for.
+        self._last_xlim = {timeline: None, correlation: None}
+
+    def _reset_chart(self, ax):
+        """Return True if ``ax`` must be re-rendered, clearing its event labels."""
+        if self._rendered_chart_version[ax] == self._chart_data_version:
+            return False
+        self._rendered_chart_version[ax] = self._chart_data_version
+        for label in self._chart_labels[ax]:
+            label.remove()
+        self._chart_labels[ax] = []
+        return True
+
+    def _autofmt_dates(self, ax):
+        """Rotate the date tick labels, but only when ``ax``'s x-range moved."""
+        xlim = ax.get_xlim()
+        if xlim != self._last_xlim[ax]:
+            self._last_xlim[ax] = xlim
+            self.fig.autofmt_xdate()
+
     def _update_chart(self, event=None):
         if not getattr(self, "matplotlib_available", False):
             return
-        chart_type = self.chart_type_var.get()
-        self.fig.clear()
+        show_timeline = self.chart_type_var.get() == "Dosing Timeline"
+        self._ax_timeline.set_visible(show_timeline)
+        self._ax_correlation.set_visible(not show_timeline)
 
-        if chart_type == "Dosing Timeline":
+        if show_timeline:
             self._generate_dosing_timeline()
-        elif chart_type == "Side Effect Correlation":
+        else:
             self._generate_side_effect_correlation()
 
-        self.canvas.draw()
+        self.canvas.draw_idle()
 
     def _generate_dosing_timeline(self):
-        import matplotlib.dates as mdates
-
-        ax = self.fig.add_subplot(111)
-        ax.set_title("Dosing Timeline (based on AI Analysis)")
-        if not self.analyzed_chart_data:
-            ax.text(
-                0.5,
-                0.5,
-                "No data. Parse a file and run AI Analysis.",
-                ha="center",
-                va="center",
-            )
+        ax = self._ax_timeline
+        if not self._reset_chart(ax):
             return
-
-        events = [
-            {
-                "time": datetime.fromisoformat(e["date"]),
-                "label": f"{e.get('medication','?')} {e.get('dosage','?')}",
-            }
-            for e in self.analyzed_chart_data
-            if e.get("medication") or e.get("dosage")
-        ]
-        if not events:
-            ax.text(
-                0.5,
-                0.5,
-                "No medication/dosage entries found by AI.",
-                ha="center",
-                va="center",
-            )
+        data = self.analyzed_chart_data
+        notice = ""
+        if not data["date"]:
+            notice = "No data. Parse a file and run AI Analysis."
+        elif not self._med_mask.any():
+            notice = "No medication/dosage entries found by AI."
+        self._timeline_notice.set_text(notice)
+        if notice:
+            self._timeline_line.set_data([], [])
             return
 
-        event_times = [e["time"] for e in events]
-        ax.plot(event_times, [1] * len(events), "o", markersize=8, color="green", alpha=0.7)
-        for event in events:
+        event_times = self._event_times[self._med_mask]
+        labels = [
+            _dose_label(medication, dosage)
+            for medication, dosage, keep in zip(data["medication"], data["dosage"], self._med_mask)
+            if keep
+        ]
+        self._timeline_line.set_data(event_times, [1] * len(event_times))
+        self._chart_labels[ax] = [
             ax.text(
-                event["time"],
+                event_time,
                 1.01,
-                event["label"],
+                label,
                 rotation=30,
                 ha="left",
                 va="bottom",
                 fontsize=8,
             )
-        ax.set_ylim(0.95, 1.05)
-        ax.set_yticks([])
-        ax.xaxis.set_major_formatter(mdates.DateFormatter("%Y-%m-%d"))
-        self.fig.autofmt_xdate()
+            for event_time, label in zip(event_times, labels)
+        ]
+        ax.relim()
+        ax.autoscale_view()
+        self._autofmt_dates(ax)
 
     def _generate_side_effect_correlation(self):
-        import matplotlib.dates as mdates
-
-        ax = self.fig.add_subplot(111)
-        ax.set_title("Medication vs. Side Effect Timeline (based on AI Analysis)")
-        if not self.analyzed_chart_data:
-            ax.text(
-                0.5,
-                0.5,
-                "No data. Parse a file and run AI Analysis.",
-                ha="center",
-                va="center",
-            )
+        ax = self._ax_correlation
+        if not self._reset_chart(ax):
             return
-
-        med_events = [
-            {
-                "time": datetime.fromisoformat(e["date"]),
-                "label": f"{e.get('medication','?')} {e.get('dosage','?')}",
-            }
-            for e in self.analyzed_chart_data
-            if e.get("medication") or e.get("dosage")
-        ]
-        side_effect_events = [
-            {
-                "time": datetime.fromisoformat(e["date"]),
-                "label": ", ".join(e["side_effects"]),
-            }
-            for e in self.analyzed_chart_data
-            if e.get("side_effects")
-        ]
-
-        if not med_events and not side_effect_events:
-            ax.text(0.5, 0.5, "No medication or side effect data found by AI.", ha="center")
+        data = self.analyzed_chart_data
+        has_med = bool(data["date"]) and self._med_mask.any()
+        has_side_effects = bool(data["date"]) and self._side_effect_mask.any()
+
+        notice = ""
+        if not data["date"]:
+            notice = "No data. Parse a file and run AI Analysis."
+        elif not has_med and not has_side_effects:
+            notice = "No medication or side effect data found by AI."
+        self._correlation_notice.set_text(notice)
+        self._correlation_legend.set_visible(not notice)
+        self._med_line.set_data([], [])
+        self._side_effect_line.set_data([], [])
+        if notice:
             return
 
-        if med_events:
-            med_times = [e["time"] for e in med_events]
-            ax.plot(
-                med_times,
-                [1] * len(med_times),
-                "o",
-                markersize=10,
-                color="blue",
-                alpha=0.7,
-                label="Medication Taken",
-            )
-            for event in med_events:
+        labels = []
+        if has_med:
+            med_times = self._event_times[self._med_mask]
+            med_labels = [
+                _dose_label(medication, dosage)
+                for medication, dosage, keep in zip(
+                    data["medication"], data["dosage"], self._med_mask
+                )
+                if keep
+            ]
+            self._med_line.set_data(med_times, [1] * len(med_times))
+            labels.extend(
                 ax.text(
-                    event["time"],
+                    event_time,
                     1.01,
-                    event["label"],
+                    label,
                     rotation=45,
                     ha="left",
                     va="bottom",
                     fontsize=9,
                 )
-
-        if side_effect_events:
-            se_times = [e["time"] for e in side_effect_events]
-            ax.plot(
-                se_times,
-                [1] * len(se_times),
-                "X",
-                markersize=12,
-                color="red",
-                alpha=0.9,
-                label="Side Effect Reported",
+                for event_time, label in zip(med_times, med_labels)
             )
-            for event in side_effect_events:
+
+        if has_side_effects:
+            se_times = self._event_times[self._side_effect_mask]
+            se_labels = [
+                ", ".join(side_effects)
+                for side_effects, keep in zip(data["side_effects"], self._side_effect_mask)
+                if keep
+            ]
+            self._side_effect_line.set_data(se_times, [1] * len(se_times))
+            labels.extend(
                 ax.text(
-                    event["time"],
+                    event_time,
                     0.99,
-                    event["label"],
+                    label,
                     rotation=-45,
                     ha="right",
                     va="top",
                     fontsize=9,
                     color="darkred",
                 )
+                for event_time, label in zip(se_times, se_labels)
+            )
 
-        ax.set_ylim(0.95, 1.05)
-        ax.set_yticks([])
-        ax.xaxis.set_major_formatter(mdates.DateFormatter("%Y-%m-%d"))
-        ax.legend(loc="upper right")
-        self.fig.autofmt_xdate()
+        self._chart_labels[ax] = labels
+        ax.relim()
+        ax.autoscale_view()
+        self._autofmt_dates(ax)
 
     # ------------------------------------------------------------------
     # Group management helpers
-    def _show_group_dialog(self, group_to_edit=None):
-        """Prompt the user to add or edit a Telegram group."""
+    def _build_group_dialog(self):
+        """Create the add/edit group dialog once; later opens only reset it."""
         dlg = tk.Toplevel(self.root)
-        dlg.title("Edit Group" if group_to_edit else "Add Group")
         dlg.resizable(False, False)
+        dlg.withdraw()
+        # Closing just hides the dialog so it can be shown again.
+        dlg.protocol("WM_DELETE_WINDOW", dlg.withdraw)
+        dlg.bind("<Escape>", lambda event: dlg.withdraw())
+
+        name_var = tk.StringVar()
+        chat_var = tk.StringVar()
+        token_var = tk.StringVar()
+
+        Label, Entry, Frame, Button = ttk.Label, ttk.Entry, ttk.Frame, ttk.Button
+        LEFT = tk.LEFT
+        Label(dlg, text="Group Name:").grid(row=0, column=0, padx=5, pady=5)
+        Entry(dlg, textvariable=name_var, width=40).grid(row=0, column=1, padx=5, pady=5)
+        Label(dlg, text="Chat ID:").grid(row=1, column=0, padx=5, pady=5)
+        Entry(dlg, textvariable=chat_var, width=40).grid(row=1, column=1, padx=5, pady=5)
+        Label(dlg, text="Bot Token (optional):").grid(row=2, column=0, padx=5, pady=5)
+        Entry(dlg, textvariable=token_var, width=40, show="*").grid(row=2, column=1, padx=5, pady=5)
+
+        btn_frame = Frame(dlg)
+        btn_frame.grid(row=3, column=0, columnspan=2, pady=(5, 10))
+        self._group_save_button = Button(btn_frame, text="Save")
+        self._group_save_button.pack(side=LEFT, padx=5)
+        Button(btn_frame, text="Cancel", command=dlg.withdraw).pack(side=LEFT, padx=5)
 
-        name_var = tk.StringVar(value=getattr(group_to_edit, "name", ""))
-        chat_var = tk.StringVar(value=getattr(group_to_edit, "chat_id", ""))
-        token_var = tk.StringVar(
-            value=getattr(group_to_edit, "bot_token", self.default_bot_token.get())
-        )
+        self._group_dialog = dlg
+        self._group_dialog_vars = (name_var, chat_var, token_var)
 
-        ttk.Label(dlg, text="Group Name:").grid(row=0, column=0, padx=5, pady=5)
-        ttk.Entry(dlg, textvariable=name_var, width=40).grid(row=0, column=1, padx=5, pady=5)
-        ttk.Label(dlg, text="Chat ID:").grid(row=1, column=0, padx=5, pady=5)
-        ttk.Entry(dlg, textvariable=chat_var, width=40).grid(row=1, column=1, padx=5, pady=5)
-        ttk.Label(dlg, text="Bot Token (optional):").grid(row=2, column=0, padx=5, pady=5)
-        ttk.Entry(dlg, textvariable=token_var, width=40, show="*").grid(row=2, column=1, padx=5, pady=5)
+    def _show_group_dialog(self, group_to_edit=None):
+        """Prompt the user to add or edit a Telegram group."""
+        if self._group_dialog is None:
+            self._build_group_dialog()
+        dlg = self._group_dialog
+        dlg.title("Edit Group" if group_to_edit else "Add Group")
+
+        # Only a new group falls back to the default token; editing shows
+        # exactly what the group has.
+        if group_to_edit:
+            name_init = group_to_edit.name
+            chat_init = group_to_edit.chat_id
+            token_init = group_to_edit.bot_token or ""
+        else:
+            name_init = chat_init = ""
+            token_init = self.default_bot_token.get()
+        name_var, chat_var, token_var = self._group_dialog_vars
+        name_var.set(name_init)
+        chat_var.set(chat_init)
+        token_var.set(token_init)
+
+        showerror = messagebox.showerror
 
         def save_action():
             name = name_var.get().strip()
             chat_id = chat_var.get().strip()
             token = token_var.get().strip() or None
             if not name or not chat_id:
-                messagebox.showerror("Missing Data", "Group name and chat ID are required.")
+                showerror("Missing Data", "Group name and chat ID are required.")
                 return
             if group_to_edit:
+                # The dialog is not modal; the group may have been removed
+                # while it was open.
+                if self._get_group(group_to_edit.id) is not group_to_edit:
+                    dlg.withdraw()
+                    return
                 group_to_edit.name = name
                 group_to_edit.chat_id = chat_id
                 group_to_edit.bot_token = token
+                self._group_dicts[group_to_edit.id] = group_to_edit.to_dict()
                 self.group_tree.item(
                     group_to_edit.id,
                     values=(name, chat_id, "Running" if group_to_edit.is_monitoring else "Stopped"),
                 )
             else:
                 new_group = TelegramGroup(name, chat_id, token)
-                self.telegram_groups[new_group.id] = new_group
+                self._add_group(new_group)
                 self.group_tree.insert("", tk.END, iid=new_group.id, values=(name, chat_id, "Stopped"))
-            self.save_group_configurations()
-            dlg.destroy()
+            self._schedule_save()
+            dlg.withdraw()
 
-        btn_frame = ttk.Frame(dlg)
-        btn_frame.grid(row=3, column=0, columnspan=2, pady=(5, 10))
-        ttk.Button(btn_frame, text="Save", command=save_action).pack(side=tk.LEFT, padx=5)
-        ttk.Button(btn_frame, text="Cancel", command=dlg.destroy).pack(side=tk.LEFT, padx=5)
+        self._group_save_button.configure(command=save_action)
+        dlg.deiconify()
+        dlg.lift()
+
+    def _add_group(self, group):
+        self._group_by_id[group.id] = group
+        self._groups.append(group)
+        self._group_dicts[group.id] = group.to_dict()
+
+    def _get_group(self, gid):
+        return self._group_by_id.get(gid)
+
+    def _remove_group(self, gid):
+        """Drop ``gid`` and return its group, or None if it is unknown."""
+        group = self._group_by_id.pop(gid, None)
+        if group is None:
+            return None
+        self._groups.remove(group)
+        self._group_dicts.pop(gid, None)
+        return group
 
     def _edit_selected_group(self):
         sel = self.group_tree.selection()
         if not sel:
             return
-        group = self.telegram_groups.get(sel[0])
+        group = self._get_group(sel[0])
         if group:
             self._show_group_dialog(group)
 
@@ -841,80 +1588,223 @@ class AdvancedTelegramParserGUI:
         if not sel:
             return
         gid = sel[0]
-        group = self.telegram_groups.pop(gid, None)
+        group = self._remove_group(gid)
         if group:
+            self._running.discard(gid)
             if group.monitor_instance:
                 group.monitor_instance.stop()
             self.group_tree.delete(gid)
-            self.save_group_configurations()
+            self._schedule_save()
+
+    def _start_group(self, group):
+        if group.id in self._running:
+            return
+        self._attach_monitor(group, self.default_bot_token.get()).start()
+
+    def _attach_monitor(self, group, default_token):
+        """Give ``group`` a new monitor and mark it running; the caller starts it."""
+        monitor = TelegramMonitor(
+            group.bot_token or default_token,
+            group.chat_id,
+            group.id,
+            self._handle_new_live_message,
+            self._log_to_monitor_feed,
+        )
+        group.monitor_instance = monitor
+        group.is_monitoring = True
+        self._running.add(group.id)
+        self._queue_status_update(group.id)
+        return monitor
+
+    def _stop_group(self, group):
+        if group.id not in self._running:
+            return
+        self._running.discard(group.id)
+        group.monitor_instance.stop()
+        group.is_monitoring = False
+        self._queue_status_update(group.id)
+
+    def _queue_status_update(self, gid):
+        """Refresh the group's status column on the next idle pass."""
+        if not self._pending_status_updates:
+            self.root.after_idle(self._flush_status_updates)
+        self._pending_status_updates.add(gid)
+
+    def _flush_status_updates(self):
+        batch, self._pending_status_updates = self._pending_status_updates, set()
+        for gid in batch:
+            group = self._get_group(gid)
+            if group is None:
+                continue  # removed before the flush ran
+            status = "Running" if group.is_monitoring else "Stopped"
+            self.group_tree.item(gid, values=(group.name, group.chat_id, status))
 
     def _start_selected_monitoring(self):
         sel = self.group_tree.selection()
-        if not sel:
-            return
-        gid = sel[0]
-        group = self.telegram_groups.get(gid)
-        if group and not group.is_monitoring:
-            token = group.bot_token or self.default_bot_token.get()
-            monitor = TelegramMonitor(
-                token, group.chat_id, gid, self._handle_new_live_message, self._log_to_monitor_feed
-            )
-            group.monitor_instance = monitor
-            monitor.start()
-            group.is_monitoring = True
-            self.group_tree.set(gid, "status", "Running")
+        group = self._get_group(sel[0]) if sel else None
+        if group:
+            self._start_group(group)
 
     def _stop_selected_monitoring(self):
         sel = self.group_tree.selection()
-        if not sel:
-            return
-        gid = sel[0]
-        group = self.telegram_groups.get(gid)
-        if group and group.is_monitoring and group.monitor_instance:
-            group.monitor_instance.stop()
-            group.is_monitoring = False
-            self.group_tree.set(gid, "status", "Stopped")
+        group = self._get_group(sel[0]) if sel else None
+        if group:
+            self._stop_group(group)
 
+    # The bulk variants go straight to the groups; driving them through the
+    # tree selection costs Tcl round-trips and <<TreeviewSelect>> events per row.
     def _start_all_monitoring(self):
-        for gid in self.telegram_groups:
-            self.group_tree.selection_set(gid)
-            self._start_selected_monitoring()
-        self.group_tree.selection_remove(*self.group_tree.selection())
+        default_token = self.default_bot_token.get()
+        monitors = [
+            self._attach_monitor(group, default_token)
+            for group in self._groups
+            if group.id not in self._running
+        ]
+        TelegramMonitor.start_many(monitors)
 
     def _stop_all_monitoring(self):
-        for gid in self.telegram_groups:
-            self.group_tree.selection_set(gid)
-            self._stop_selected_monitoring()
-        self.group_tree.selection_remove(*self.group_tree.selection())
+        for group in self._groups:
+            self._stop_group(group)
 
     def load_group_configurations(self):
-        """Load saved group configs from disk."""
-        if not os.path.exists(GROUPS_CONFIG_FILE):
-            return
+        """Load saved group configs on a worker thread; the tree fills in batch by batch."""
+        threading.Thread(target=self._read_group_configurations, daemon=True).start()
+        self.root.after(CONFIG_POLL_MS, self._poll_loaded_groups)
+
+    def _read_group_configurations(self):
+        """Stream saved groups to the Tk thread in batches.
+
+        The end is marked by an int, the number of entries skipped as invalid;
+        the reader runs before ``mainloop`` and so never logs itself.
+        """
+        batch = []
+        skipped = 0
+        # Raw bytes go straight to the decoder; a missing file is just an
+        # OSError like any other read failure. Groups read before an error
+        # are kept, and undecodable lines are counted as skipped.
         try:
-            with open(GROUPS_CONFIG_FILE, "r", encoding="utf-8") as fh:
-                raw = json.load(fh)
-            for entry in raw:
-                grp = TelegramGroup(
-                    entry.get("name", "Unknown"),
-                    entry.get("chat_id", ""),
-                    entry.get("bot_token"),
-                    entry.get("auto_save", False),
-                )
-                self.telegram_groups[grp.id] = grp
-                self.group_tree.insert("", tk.END, iid=grp.id, values=(grp.name, grp.chat_id, "Stopped"))
-        except (OSError, json.JSONDecodeError):
+            with open(GROUPS_CONFIG_FILE, "rb", buffering=CONFIG_READ_BUFFER) as fh:
+                for entry in _iter_group_entries(fh):
+                    if type(entry) is not dict:
+                        skipped += 1
+                        continue
+                    batch.append(entry)
+                    if len(batch) >= CONFIG_LOAD_BATCH:
+                        self._loaded_groups.put(batch)
+                        batch = []
+        except OSError:
             pass
+        if batch:
+            self._loaded_groups.put(batch)
+        self._loaded_groups.put(skipped)
+
+    def _poll_loaded_groups(self):
+        # Worker threads hand results over through a queue; only the Tk
+        # thread touches widgets. One batch per callback lets the tree
+        # repaint while a large config is still loading.
+        try:
+            item = self._loaded_groups.get_nowait()
+        except queue.Empty:
+            self.root.after(CONFIG_POLL_MS, self._poll_loaded_groups)
+            return
+        if item.__class__ is list:
+            try:
+                self._insert_loaded_groups(item)
+            finally:
+                # Keep draining after a failed batch: saves stay deferred
+                # until the end marker sets _groups_loaded.
+                self.root.after_idle(self._poll_loaded_groups)
+            return
+        skipped = item
+        if skipped:
+            self._log_to_monitor_feed(
+                f"Skipped {skipped} invalid entries in {GROUPS_CONFIG_FILE}.", "WARNING"
+            )
+        self._groups_loaded = True
+        if self._save_after_load:
+            self._save_after_load = False
+            self._schedule_save()
+
+    def _insert_loaded_groups(self, batch):
+        rows = []
+        for entry in batch:
+            grp = TelegramGroup(
+                entry.get("name", "Unknown"),
+                entry.get("chat_id", ""),
+                entry.get("bot_token"),
+                entry.get("auto_save", False),
+            )
+            self._add_group(grp)
+            rows += (grp.id, grp.name, grp.chat_id)
+        # One Tcl call inserts the whole batch. The rows travel as a Tcl list
+        # object, so names need no escaping.
+        tree = self.group_tree
+        tree.tk.call("apply", _TREE_BULK_INSERT, str(tree), tuple(rows))
+
+    def _config_writer(self):
+        """Write config snapshots from ``_io_queue``; ``None`` stops the thread."""
+        stop = False
+        while not stop:
+            data = self._io_queue.get()
+            # Only the newest snapshot matters; skip any that were superseded.
+            while True:
+                try:
+                    newer = self._io_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if newer is None:
+                    stop = True
+                else:
+                    data = newer
+            if data is None:
+                break
+            payload = b"".join(_json_dumps(entry) + b"\n" for entry in data)
+            # Edits that net out to no change (a cancelled rename, a save
+            # scheduled by a no-op) cost no I/O.
+            payload_hash = hash(payload)
+            if payload_hash == self._last_saved_hash:
+                continue
+            tmp_path = f"{GROUPS_CONFIG_FILE}.tmp"
+            # One full write to a sibling file, synced, then an atomic rename:
+            # a crash leaves either the old config or the new one, never half.
+            try:
+                with open(tmp_path, "wb") as fh:
+                    fh.write(payload)
+                    fh.flush()
+                    os.fsync(fh.fileno())
+                os.replace(tmp_path, GROUPS_CONFIG_FILE)
+                self._last_saved_hash = payload_hash
+            except OSError:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    def _schedule_save(self):
+        """Coalesce config changes into a single write shortly after the first."""
+        if self._save_after_id is None:
+            self._save_after_id = self.root.after(SAVE_DEBOUNCE_MS, self._flush_save)
+
+    def _flush_save(self):
+        """Write pending config changes now; a no-op when nothing is pending."""
+        if self._save_after_id is None:
+            return
+        self.root.after_cancel(self._save_after_id)
+        self._save_after_id = None
+        self.save_group_configurations()
 
     def save_group_configurations(self):
-        data = [grp.to_dict() for grp in self.telegram_groups.values()]
-        try:
-            with open(GROUPS_CONFIG_FILE, "w", encoding="utf-8") as fh:
-                json.dump(data, fh, indent=2)
-        except OSError:
-            pass
+        """Queue a snapshot of all groups for the config writer thread."""
+        if not self._groups_loaded:
+            # Writing now would drop the groups that are still being read.
+            self._save_after_load = True
+            return
+        self._io_queue.put(list(self._group_dicts.values()))
 
     def on_closing(self):
+        self._flush_save()
+        self._io_queue.put(None)
+        self._io_thread.join(timeout=5)
         self.root.destroy()
 
 